@@ -43,11 +43,12 @@ class LSTM_Control(Environment):
         self.target = jax.random.uniform(generate_key(), shape=(self.y_dim,), minval=-1, maxval=1)
 
         glorot_init = stax.glorot() # returns a function that initializes weights
-        self.W_hh = glorot_init(generate_key(), (4*self.hid_dim, self.hid_dim)) # maps h_t to gates
-        self.W_uh = glorot_init(generate_key(), (4*self.hid_dim, self.u_dim)) # maps x_t to gates
+        keys = jax.random.split(generate_key(), 3) # one split for all three weight matrices
+        self.W_hh = glorot_init(keys[0], (4*self.hid_dim, self.hid_dim)) # maps h_t to gates
+        self.W_uh = glorot_init(keys[1], (4*self.hid_dim, self.u_dim)) # maps x_t to gates
         self.b_h = np.zeros(4*self.hid_dim)
         self.b_h = jax.ops.index_update(self.b_h, jax.ops.index[self.hid_dim:2*self.hid_dim], np.ones(self.hid_dim)) # forget gate biased initialization
-        self.W_out = glorot_init(generate_key(), (self.y_dim, self.hid_dim)) # maps h_t to output
+        self.W_out = glorot_init(keys[2], (self.y_dim, self.hid_dim)) # maps h_t to output
         # self.cell = np.zeros(self.hid_dim) # long-term memory
         # self.hid = np.zeros(self.hid_dim) # short-term memory
         self.hid_cell = np.hstack((np.zeros(self.hid_dim), np.zeros(self.hid_dim)))
@@ -5,6 +5,9 @@ PyBullet Pendulum enviornment
 from pybullet_envs.bullet.kukaGymEnv import KukaGymEnv
 from tigercontrol.environments.deprecated.pybullet.pybullet_environment import PyBulletEnvironment
 
+# Bullet clients are expensive to start, so one KukaGymEnv per render setting is shared by all instances
+_ENV_CACHE = {}
+
 
 class Kuka(PyBulletEnvironment):
     """
@@ -15,14 +18,16 @@ class Kuka(PyBulletEnvironment):
 
     def initialize(self, render=False):
         self.initialized = True
-        self._env = KukaGymEnv(renders=render)
+        if render not in _ENV_CACHE:
+            _ENV_CACHE[render] = KukaGymEnv(renders=render)
+        self._env = _ENV_CACHE[render]
         self.observation_space = self._env.observation_space.shape
         self.action_space = self._env.action_space.shape
         self.state = {}
         initial_obs = self.reset()
         return initial_obs
 
-
-
-
-
+    def close(self):
+        # the underlying env is shared with other Kuka instances, so only detach from it
+        self.initialized = False
+        self._env = None
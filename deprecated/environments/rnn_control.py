@@ -16,13 +16,14 @@ class RNN_Control(Environment):
     def __init__(self):
         self.initialized = False
 
-    def initialize(self, n, m, h=64):
+    def initialize(self, n, m, h=64, dtype=np.float32):
         """
         Description: Randomly initialize the RNN.
         Args:
             n (int): Input dimension.
             m (int): Observation/output dimension.
             h (int): Default value 64. Hidden dimension of RNN.
+            dtype (numpy.dtype): Default value float32. Dtype of RNN parameters and hidden state.
         Returns:
             The first value in the time-series
         """
@@ -31,11 +32,12 @@ class RNN_Control(Environment):
         self.n, self.m, self.h = n, m, h
 
         glorot_init = stax.glorot() # returns a function that initializes weights
-        self.W_h = glorot_init(generate_key(), (h, h))
-        self.W_u = glorot_init(generate_key(), (h, n))
-        self.W_out = glorot_init(generate_key(), (m, h))
-        self.b_h = np.zeros(h)
-        self.hid = np.zeros(h)
+        keys = jax.random.split(generate_key(), 3) # one split for all three weight matrices
+        self.W_h = glorot_init(keys[0], (h, h)).astype(dtype)
+        self.W_u = glorot_init(keys[1], (h, n)).astype(dtype)
+        self.W_out = glorot_init(keys[2], (m, h)).astype(dtype)
+        self.b_h = np.zeros(h, dtype=dtype)
+        self.hid = np.zeros(h, dtype=dtype)
 
         self.rollout_controller = None
         self.target = jax.random.uniform(generate_key(), shape=(self.m,), minval=-1, maxval=1)
@@ -30,10 +30,11 @@ def test_lds(steps=1000, show_plot=False, verbose=False):
     environment.reset(n, m, d=None, partially_observable=False, noise_distribution=custom_nd_scalar) #, system_params={})
 
 
+    # sample all T inputs with a single key instead of splitting a fresh key every step
+    us = random.normal(generate_key(), shape=(T, m))
     test_output = []
     for t in range(T):
-        u = random.normal(generate_key(), shape=(m,))
-        test_output.append(environment.step(u))
+        test_output.append(environment.step(us[t]))
 
     info = environment.hidden()
     if verbose:
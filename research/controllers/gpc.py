@@ -28,11 +28,11 @@ class GPC(Controller):
     def _get_dims(self):
         try:
             n = self.B.shape[0] ## dimension of  the state x 
-        except:
+        except (AttributeError, IndexError): # scalar B
             n = 1
         try:
             m = self.B.shape[1] ## dimension of the control u
-        except:
+        except (AttributeError, IndexError): # scalar B
             m = 1
         return (n, m)
 
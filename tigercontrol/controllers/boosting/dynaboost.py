@@ -2,6 +2,7 @@ import tigercontrol
 from tigercontrol.controllers import Controller
 from tigercontrol.controllers.core import quad_loss, action_loss
 from tigercontrol.controllers.core import update_noise
+from tigercontrol.utils import push_history_donated
 
 import jax
 import jax.numpy as np
@@ -93,9 +94,7 @@ class DynaBoost(Controller):
     def update_history(self, x = None):
         self.w = update_noise(self.w, x, self.past_partial_actions[-1][-1], self.env)
         self.x = x
-        self.past_partial_actions = jax.ops.index_update(self.past_partial_actions,\
-                                    jax.ops.index[:, 0], self.get_partial_actions(x))
-        self.past_partial_actions = np.roll(self.past_partial_actions, -1, axis = 1)
+        self.past_partial_actions = push_history_donated(self.past_partial_actions, self.get_partial_actions(x), 1)
 
     def get_action(self, x):
         return self.get_partial_actions(x)[-1]
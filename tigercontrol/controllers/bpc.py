@@ -8,6 +8,7 @@ from tigercontrol.utils import generate_key
 import jax
 import scipy
 from tigercontrol.controllers import LQR
+from tigercontrol.utils import push_history_donated
 
 # BPC definition
 class BPC(Controller):
@@ -53,19 +54,16 @@ class BPC(Controller):
             self.M *= (1-self.delta) / norm
             
         # 4. Get new epsilon for M
-        self.eps = jax.ops.index_update(self.eps, 0, self._generate_uniform(
+        self.eps = push_history_donated(self.eps, self._generate_uniform(
                     shape = (self.H, self.m, self.n), norm = np.sqrt(1 - np.linalg.norm(self.eps[1:])**2)))
-        self.eps = np.roll(self.eps, -1, axis = 0)
 
         # 5. Get new epsilon for bias
-        self.eps_bias = jax.ops.index_update(self.eps_bias, 0, self._generate_uniform(
+        self.eps_bias = push_history_donated(self.eps_bias, self._generate_uniform(
                     shape = (self.m, 1), norm = np.sqrt(1 - np.linalg.norm(self.eps_bias[1:])**2)))
-        self.eps_bias = np.roll(self.eps_bias, -1, axis = 0)
 
     def get_action(self, x):
         # 1. Get new noise
-        self.w = jax.ops.index_update(self.w, 0, x - self.A @ self.x - self.B @ self.u)
-        self.w = np.roll(self.w, -1, axis = 0)
+        self.w = push_history_donated(self.w, x - self.A @ self.x - self.B @ self.u)
 
         # 5. Update x
         self.x = x
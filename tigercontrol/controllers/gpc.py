@@ -13,6 +13,7 @@ from tigercontrol.utils import generate_key
 import jax
 import scipy
 from tigercontrol.controllers import LQR
+from tigercontrol.utils import push_history_donated
 
 
 quad = lambda x, u: np.sum(x.T @ x + u.T @ u)
@@ -51,15 +52,16 @@ class GPC(Controller):
 
         # The Surrogate Cost Function
         def policy_loss(M, w, cost_t = cost_fn):
-            y = np.zeros((n, 1))
-            for h in range(HH - 1):
-                v = -self.K @ y + np.tensordot(M, w[h : h + H], axes = ([0, 2], [0, 1]))
-                y = A @ y + B @ v + w[h + H]
+            # scan traces the rollout step once instead of unrolling HH - 1 copies
+            def evolve(y, h):
+                v = -self.K @ y + np.tensordot(M, jax.lax.dynamic_slice_in_dim(w, h, H), axes = ([0, 2], [0, 1]))
+                return A @ y + B @ v + w[h + H], None
+            y, _ = jax.lax.scan(evolve, np.zeros((n, 1)), np.arange(HH - 1))
             # Don't update state at the end
-            h += 1
-            v = -self.K @ y + np.tensordot(M, w[h : h + H], axes = ([0, 2], [0, 1]))
+            v = -self.K @ y + np.tensordot(M, w[HH - 1 : HH - 1 + H], axes = ([0, 2], [0, 1]))
             return cost_t(y, v)
 
+        self.policy_loss = policy_loss
         self.grad = grad(policy_loss)
 
         # If cost function stays the same throughout run, jit the gradient for efficiency
@@ -78,8 +80,7 @@ class GPC(Controller):
 
     def get_action(self, x):
         # 1. Get new noise (will be located at w[-1])
-        self.w = jax.ops.index_update(self.w, 0, x - self.A @ self.x - self.B @ self.u)
-        self.w = np.roll(self.w, -1, axis = 0)
+        self.w = push_history_donated(self.w, x - self.A @ self.x - self.B @ self.u)
 
         # 2. Update x
         self.x = x
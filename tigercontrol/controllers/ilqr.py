@@ -3,9 +3,53 @@ Iterative Linear Quadratic Regulator
 """
 import jax
 import jax.numpy as np
+from functools import lru_cache
 import tigercontrol
 from tigercontrol.controllers import Controller
 
+
+@lru_cache(maxsize=None)
+def _make_lqr_iteration(dim_x):
+    """
+    Description: returns a jitted single step of the LQR backward recursion for state dimension
+    dim_x, built once per dim_x and shared by all ILQR instances.
+    """
+    def lqr_iteration(F_t, C_t, c_t, V, v, lamb):
+        Q = C_t + F_t.T @ V @ F_t
+        q = c_t + F_t.T @ v
+
+        Q_uu, Q_ux, Q_xx = Q[dim_x:, dim_x:], Q[dim_x:, :dim_x], Q[:dim_x, :dim_x]
+        q_u, q_x = q[dim_x:], q[:dim_x]
+        Q_uu_evals, Q_uu_evecs = np.linalg.eigh(Q_uu)
+        Q_uu_evals = lamb + np.maximum(Q_uu_evals, 0.0)
+        Q_uu_inv = Q_uu_evecs @ np.diag(1. / Q_uu_evals) @ Q_uu_evecs.T
+
+        K_t = -Q_uu_inv @ Q_ux
+        k_t = -Q_uu_inv @ q_u
+        V = Q_xx + Q_ux.T @ K_t + K_t.T @ Q_ux + K_t.T @ Q_uu @ K_t
+        v = q_x + Q_ux.T @ k_t + K_t.T @ q_u + K_t.T @ Q_uu @ k_t
+        return K_t, k_t, V, v
+    return jax.jit(lqr_iteration)
+
+
+@lru_cache(maxsize=None)
+def _make_backward_pass(dim_x):
+    """
+    Description: LQR backward recursion over a whole linearized trajectory, run as a single
+    reverse scan. Compiled once per dim_x; lamb is traced so changing it does not recompile.
+    """
+    lqr_iteration = _make_lqr_iteration(dim_x)
+    def backward_pass(F, C, c, lamb):
+        def backward(carry, linearization_t):
+            V, v = carry
+            K_t, k_t, V, v = lqr_iteration(*linearization_t, V, v, lamb)
+            return (V, v), (K_t, k_t)
+        V, v = np.zeros((dim_x, dim_x)), np.zeros((dim_x,))
+        _, (K, k) = jax.lax.scan(backward, (V, v), (F, C, c), reverse=True)
+        return K, k
+    return jax.jit(backward_pass)
+
+
 class ILQR(Controller):
     """
     Description: Computes optimal set of actions using the Linear Quadratic Regulator
@@ -45,29 +89,7 @@ class ILQR(Controller):
         self.lamb = lamb
         self.threshold = threshold
 
-        """ 
-        Description: run LQR on provided matrices (this version computes delta-x and delta-u).
-        dyn: dynamics, T: number of time steps to plan, x: current states, u: current actions
-        F, f: dynamics linearization, C,c: cost linearization
-        """
-        @jax.jit
-        def lqr_iteration(F_t, C_t, c_t, V, v, lamb):
-            dim_x, dim_u = self.dim_x, self.dim_u
-            Q = C_t + F_t.T @ V @ F_t
-            q = c_t + F_t.T @ v
-
-            Q_uu, Q_ux, Q_xx = Q[dim_x:, dim_x:], Q[dim_x:, :dim_x], Q[:dim_x, :dim_x]
-            q_u, q_x = q[dim_x:], q[:dim_x]
-            Q_uu_evals, Q_uu_evecs = np.linalg.eigh(Q_uu)
-            Q_uu_evals = lamb + np.maximum(Q_uu_evals, 0.0)
-            Q_uu_inv = Q_uu_evecs @ np.diag(1. / Q_uu_evals) @ Q_uu_evecs.T
-
-            K_t = -Q_uu_inv @ Q_ux
-            k_t = -Q_uu_inv @ q_u
-            V = Q_xx + Q_ux.T @ K_t + K_t.T @ Q_ux + K_t.T @ Q_uu @ K_t
-            v = q_x + Q_ux.T @ k_t + K_t.T @ q_u + K_t.T @ Q_uu @ k_t
-            return K_t, k_t, V, v
-        self._lqr_iteration = lqr_iteration
+        self._backward_pass = _make_backward_pass(self.dim_x)
 
         """ 
         Description: linearize provided system dynamics and loss, given initial state and actions. 
@@ -108,17 +130,9 @@ class ILQR(Controller):
         F = transcript['dynamics_grad']
         C = transcript['loss_hessian']
         c = transcript['loss_grad']
-        lamb = self.lamb
-
-        dim_x, dim_u = self.dim_x, self.dim_u
-        V, v = np.zeros((dim_x, dim_x)), np.zeros((dim_x,))
-        K, k = T * [None], T * [None]
 
         ## Backward Recursion ##
-        for t in reversed(range(T)):
-            K_t, k_t, V, v = self._lqr_iteration(F[t], C[t], c[t], V, v, lamb)
-            K[t] = K_t
-            k[t] = k_t
+        K, k = self._backward_pass(F, C, c, self.lamb)
         return self.OpenLoopController(u_old, x_old, K, k)
 
     def plan(self, x_0, T):
@@ -159,14 +173,11 @@ class ILQR(Controller):
         transcript = {'x': trajectory[:,:self.dim_x], 'u': trajectory[:,self.dim_x:]}
         # transcript = {'x': trajectory[:,:self.dim_x,], 'u': trajectory[:,self.dim_x:,]}
 
-        # optional derivatives
-        if dynamics_grad: transcript['dynamics_grad'] = []
-        if loss_grad: transcript['loss_grad'] = []
-        if loss_hessian: transcript['loss_hessian'] = []
-        for x, u in zip(transcript['x'], transcript['u']):
-            if dynamics_grad: transcript['dynamics_grad'].append(self.env.get_dynamics_jacobian()(x, u))
-            if loss_grad: transcript['loss_grad'].append(self.env.get_loss_grad()(x, u))
-            if loss_hessian: transcript['loss_hessian'].append(self.env.get_loss_hessian()(x, u))
+        # optional derivatives, each evaluated over the whole trajectory in one batched call
+        x, u = transcript['x'], transcript['u']
+        if dynamics_grad: transcript['dynamics_grad'] = jax.vmap(self.env.get_dynamics_jacobian())(x, u)
+        if loss_grad: transcript['loss_grad'] = jax.vmap(self.env.get_loss_grad())(x, u)
+        if loss_hessian: transcript['loss_hessian'] = jax.vmap(self.env.get_loss_hessian())(x, u)
         # transcript['x'] = [np.reshape(x, (x.shape[0], 1)) for x in transcript['x']]
         # transcript['u'] = [np.reshape(u, (u.shape[0], 1)) for u in transcript['u']]
         return transcript
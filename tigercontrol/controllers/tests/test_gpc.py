@@ -0,0 +1,41 @@
+"""
+Tests for the GPC surrogate loss
+"""
+import jax
+import jax.numpy as np
+import jax.random as random
+import numpy as onp
+from tigercontrol.controllers import GPC
+from tigercontrol.controllers.gpc import quad
+from tigercontrol.utils.random import generate_key
+
+
+def test_gpc():
+    test_policy_loss()
+    print("test_gpc passed")
+
+
+def test_policy_loss():
+    """ Description: the scanned policy_loss and its gradient must match the unrolled loop they replaced """
+    n, m = 3, 2
+    A, B = 0.5 * onp.identity(n), onp.ones((n, m)) / n
+    for H, HH in [(3, 3), (2, 5)]:
+        gpc = GPC(A, B, H = H, HH = HH)
+        M = random.normal(generate_key(), shape=(H, m, n))
+        w = random.normal(generate_key(), shape=(H + HH, n, 1))
+
+        def unrolled_loss(M, w):
+            y = np.zeros((n, 1))
+            for h in range(HH - 1):
+                v = -gpc.K @ y + np.tensordot(M, w[h : h + H], axes = ([0, 2], [0, 1]))
+                y = A @ y + B @ v + w[h + H]
+            h = HH - 1
+            v = -gpc.K @ y + np.tensordot(M, w[h : h + H], axes = ([0, 2], [0, 1]))
+            return quad(y, v)
+
+        assert np.allclose(gpc.policy_loss(M, w), unrolled_loss(M, w), rtol=1e-4, atol=1e-4)
+        assert np.allclose(gpc.grad(M, w), jax.grad(unrolled_loss)(M, w), rtol=1e-4, atol=1e-4)
+
+
+if __name__ == "__main__":
+    test_gpc()
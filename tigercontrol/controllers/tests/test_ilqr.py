@@ -0,0 +1,37 @@
+"""
+Tests for the ILQR backward recursion
+"""
+import jax.numpy as np
+import jax.random as random
+from tigercontrol.controllers.ilqr import _make_lqr_iteration, _make_backward_pass
+from tigercontrol.utils.random import generate_key
+
+
+def test_ilqr():
+    test_backward_pass()
+    print("test_ilqr passed")
+
+
+def test_backward_pass():
+    """ Description: the scanned backward pass must match the per-step loop it replaced """
+    T, dim_x, dim_u, lamb = 5, 3, 2, 1.0
+    d = dim_x + dim_u
+    F = 0.5 * random.normal(generate_key(), shape=(T, dim_x, d))
+    L = random.normal(generate_key(), shape=(T, d, d))
+    C = np.matmul(L, np.transpose(L, (0, 2, 1))) # symmetric positive semidefinite cost hessians
+    c = random.normal(generate_key(), shape=(T, d))
+
+    lqr_iteration = _make_lqr_iteration(dim_x)
+    V, v = np.zeros((dim_x, dim_x)), np.zeros((dim_x,))
+    K_loop, k_loop = T * [None], T * [None]
+    for t in reversed(range(T)):
+        K_loop[t], k_loop[t], V, v = lqr_iteration(F[t], C[t], c[t], V, v, lamb)
+
+    K, k = _make_backward_pass(dim_x)(F, C, c, lamb)
+    assert K.shape == (T, dim_u, dim_x) and k.shape == (T, dim_u)
+    assert np.allclose(K, np.stack(K_loop), rtol=1e-4, atol=1e-4)
+    assert np.allclose(k, np.stack(k_loop), rtol=1e-4, atol=1e-4)
+
+
+if __name__ == "__main__":
+    test_ilqr()
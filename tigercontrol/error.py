@@ -80,7 +80,7 @@ class APIError(Error):
         if http_body and hasattr(http_body, 'decode'):
             try:
                 http_body = http_body.decode('utf-8')
-            except:
+            except UnicodeDecodeError:
                 http_body = ('<Could not decode body as utf-8. '
                              'Please report to gym@openai.com>')
 
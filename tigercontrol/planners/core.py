@@ -4,6 +4,7 @@ import tigercontrol
 import jax
 import jax.numpy as np
 from tigercontrol import error
+from tigercontrol.utils import push_history
 
 # class for implementing algorithms with enforced modularity
 # ---------- Losses ----------
@@ -67,6 +68,7 @@ def action_loss(actions, w, look_back, env, cost_fn = quad_loss):
 # ---------- History Updates ----------
 
 def update_noise(w, x, u, env):
-    w = jax.ops.index_update(w, 0, x - env.dyn(x, u))
-    w = np.roll(w, -1, axis = 0) # new noise will be located at w[-1]
-    return w
+    """
+    Description: Returns the history w with the noise x - env.dyn(x, u) appended at w[-1].
+    """
+    return push_history(w, x - env.dyn(x, u)) # new noise will be located at w[-1]
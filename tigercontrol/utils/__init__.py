@@ -1,4 +1,5 @@
 # utils init file
 
 from tigercontrol.utils.registration_tools import Spec, Registry, get_tigercontrol_dir
-from tigercontrol.utils.random import set_key, generate_key, get_global_key
\ No newline at end of file
+from tigercontrol.utils.random import set_key, generate_key, get_global_key
+from tigercontrol.utils.history import push_history, push_history_donated
@@ -5,6 +5,7 @@ Hyperparameter tuning using (optionally random) Grid Search.
 import tigercontrol
 from tigercontrol.utils.random import generate_key
 import jax.numpy as np
+import numpy as onp
 import jax
 from jax import jit, grad, random
 import itertools
@@ -41,24 +42,19 @@ class GridSearch:
         self.loss = loss
 
         # store the order to test parameters
-        param_list = list(itertools.product(*[v for k, v in search_space.items()]))
+        param_names = list(search_space.keys())
+        param_list = list(itertools.product(*[search_space[k] for k in param_names]))
         index = np.arange(len(param_list)) # np.random.shuffle doesn't work directly on non-JAX objects
-        shuffled_index = random.shuffle(generate_key(), index)
+        shuffled_index = onp.asarray(random.shuffle(generate_key(), index)) # single device to host copy
         param_order = [param_list[i] for i in shuffled_index] # shuffle order of elements
 
-        # helper controller
-        def _update_smoothing(l, val):
-            """ update smoothing loss list with new val """
-            return jax.ops.index_update(np.roll(l, 1), 0, val)
-        self._update_smoothing = jit(_update_smoothing)
-
         # store optimal params and optimal loss
         optimal_params, optimal_loss = {}, None
         t = 0
         for params in param_order: # loop over all params in the given order
             t += 1
             curr_params = controller_params.copy()
-            curr_params.update({k:v for k, v in zip(search_space.keys(), params)})
+            curr_params.update(zip(param_names, params))
             loss = self._run_test(curr_params, smoothing=smoothing, min_steps=min_steps, verbose=verbose)
             if not optimal_loss or loss < optimal_loss:
                 optimal_params = curr_params
@@ -83,7 +79,8 @@ class GridSearch:
 
         t = 0
         losses = [] # sorted losses, used to get median
-        smooth_losses = np.zeros(smoothing) # store previous losses to get smooth loss
+        smooth_losses = onp.zeros(smoothing) # host-side ring buffer of previous losses to get smooth loss
+        oldest = 0 # index of the oldest loss in smooth_losses
         while True: # run controller until worse than median loss, ignoring first 100 steps
             t += 1
             y_pred = controller.predict(x)
@@ -95,11 +92,11 @@ class GridSearch:
                 controller.update(x)
                 loss = self.loss(y_pred, x)
             if t == 1: # fill all of smooth_losses with the first loss
-                for i in range(smoothing):
-                    smooth_losses = self._update_smoothing(smooth_losses, loss)
-            else: # else replace only the oldest loss
-                smooth_losses = self._update_smoothing(smooth_losses, loss)
-            smooth_loss = np.mean(smooth_losses)
+                smooth_losses[:] = loss
+            else: # else replace only the oldest loss in place
+                smooth_losses[oldest] = loss
+                oldest = (oldest + 1) % smoothing
+            smooth_loss = float(onp.mean(smooth_losses)) # host-side reduction, avoids an XLA dispatch per step
             if t % smoothing == 0:
                 self._add_to_list(losses, smooth_loss)
                 if self._halting_rule(losses, smooth_loss) and t >= min_steps: break
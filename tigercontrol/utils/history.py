@@ -0,0 +1,30 @@
+"""
+Fixed-length history buffers shared by controllers and planners
+"""
+
+import jax
+import jax.numpy as np
+
+
+def _push_history(history, new, axis = 0):
+    """
+    Description: Drops the oldest entry of history along axis and appends new as the last
+        entry, in a single copy rather than an index update followed by a roll.
+
+    Args:
+        history (numpy.ndarray): buffer of past values, oldest first along axis
+        new (numpy.ndarray): value to append, shaped like history without axis
+        axis (int): axis along which history is ordered
+
+    Returns:
+        The updated history buffer
+    """
+    older = jax.lax.slice_in_dim(history, 1, history.shape[axis], axis = axis)
+    return np.concatenate((older, np.expand_dims(new, axis)), axis = axis)
+
+# leaves the input buffer intact, so it is safe in shared helpers whose callers may keep it
+push_history = jax.jit(_push_history, static_argnums=(2,))
+
+# donates the input buffer so XLA can reuse it for the result; only for callers that own the
+# buffer and immediately rebind it to the returned array
+push_history_donated = jax.jit(_push_history, static_argnums=(2,), donate_argnums=(0,))
@@ -0,0 +1,34 @@
+"""
+Tests for the history buffers in tigercontrol.utils.history
+"""
+import jax
+import jax.numpy as np
+import jax.random as random
+from tigercontrol.utils.history import push_history, push_history_donated
+from tigercontrol.utils.random import generate_key
+
+
+def test_history():
+    test_push_history()
+    print("test_history passed")
+
+
+def test_push_history():
+    """ Description: push_history must match the index update followed by a roll it replaced """
+    w = random.normal(generate_key(), shape=(6, 3, 1))
+    w_new = random.normal(generate_key(), shape=(3, 1))
+    expected = np.roll(jax.ops.index_update(w, 0, w_new), -1, axis = 0)
+    assert np.allclose(push_history(w, w_new), expected)
+    assert np.allclose(push_history_donated(np.array(w), w_new), expected) # copy w, since it is donated
+    assert np.allclose(push_history(w, w_new), expected) # non-donating push leaves w usable
+
+    # same check along a later axis, as used for DynaBoost's partial actions
+    a = random.normal(generate_key(), shape=(4, 3, 2, 1))
+    a_new = random.normal(generate_key(), shape=(4, 2, 1))
+    expected = np.roll(jax.ops.index_update(a, jax.ops.index[:, 0], a_new), -1, axis = 1)
+    assert np.allclose(push_history(a, a_new, 1), expected)
+    assert np.allclose(push_history_donated(np.array(a), a_new, 1), expected)
+
+
+if __name__ == "__main__":
+    test_history()